@@ -1,5 +1,7 @@
 #!/usr/bin/env node
 const path = require('path');
+const readline = require('readline');
+const { spawn } = require('child_process');
 const async_hooks = require('async_hooks');
 const { analyzeFile: runStaticAnalyzer } = require('./static_analyzer');
 
@@ -532,7 +534,64 @@ async function analyze(request) {
     return response;
 }
 
+// Run one request in a fresh bridge process. Verdicts depend on heap deltas and
+// live async resources, so requests must not share a warmed-up process.
+function analyzeIsolated(request) {
+    return new Promise((resolve) => {
+        const child = spawn(process.execPath, [...process.execArgv, __filename], {
+            stdio: ['pipe', 'pipe', 'pipe']
+        });
+        const stdout = [];
+        const stderr = [];
+        child.stdout.on('data', (chunk) => stdout.push(chunk));
+        child.stderr.on('data', (chunk) => stderr.push(chunk));
+        child.on('error', (error) => resolve(errorResponse(error, request.session_id || 'unknown')));
+        child.on('close', (code) => {
+            for (const output of [stdout, stderr]) {
+                try {
+                    resolve(JSON.parse(Buffer.concat(output).toString('utf8')));
+                    return;
+                } catch (parseError) {
+                    // Fall through to the next stream.
+                }
+            }
+            const sessionId = request.session_id || request.sessionId || 'unknown';
+            resolve(errorResponse(new Error(`Analyzer process exited with code ${code} without a response`), sessionId));
+        });
+        child.stdin.end(JSON.stringify(request));
+    });
+}
+
+// NDJSON mode (--ndjson): one request per stdin line, one compact response per
+// stdout line, written as soon as each analysis finishes. Each request runs in
+// its own child process so earlier requests cannot affect later verdicts.
+async function serveNdjson() {
+    const lines = readline.createInterface({ input: process.stdin, crlfDelay: Infinity });
+    for await (const line of lines) {
+        if (!line.trim()) {
+            continue;
+        }
+        let response;
+        try {
+            const request = JSON.parse(line);
+            if (request === null || typeof request !== 'object' || Array.isArray(request)) {
+                throw new Error('Invalid request: expected a JSON object');
+            }
+            response = await analyzeIsolated(request);
+        } catch (error) {
+            const e = error instanceof SyntaxError ? new Error(`Invalid JSON: ${error.message}`) : error;
+            response = errorResponse(e);
+        }
+        process.stdout.write(JSON.stringify(response) + '\n');
+    }
+    process.exit(0);
+}
+
 async function main() {
+    if (process.argv.includes('--ndjson')) {
+        await serveNdjson();
+        return;
+    }
     try {
         const chunks = [];
         for await (const chunk of process.stdin) {
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import argparse
+import json
 import os
 import subprocess
 import sys
@@ -39,28 +40,130 @@ def _ensure_rust_binary():
     return binary_path
 
 
-def _run_analyze(args):
-    """Delegate analyze command to Rust binary."""
-    cmd = [str(_ensure_rust_binary()), "analyze", "--target", args.target]
+def _build_analyze_cmd(target, inputs, repeat, timeout, log_dir, language, analysis_mode, output_format, verbose):
+    """Build the Rust binary invocation for a single analyze request."""
+    cmd = [str(_ensure_rust_binary()), "analyze", "--target", target]
 
-    for inp in args.input:
+    for inp in inputs:
         cmd.extend(["--input", inp])
 
-    cmd.extend(["--repeat", str(args.repeat)])
-    cmd.extend(["--timeout", str(args.timeout)])
-    cmd.extend(["--output-dir", args.log_dir])
+    cmd.extend(["--repeat", str(repeat)])
+    cmd.extend(["--timeout", str(timeout)])
+    cmd.extend(["--output-dir", log_dir])
 
-    _append_if_set(cmd, "--language", args.language)
-    if hasattr(args, "analysis_mode"):
-        cmd.extend(["--analysis-mode", args.analysis_mode])
+    _append_if_set(cmd, "--language", language)
+    if analysis_mode is not None:
+        cmd.extend(["--analysis-mode", analysis_mode])
+    _append_if_set(cmd, "--format", output_format)
 
-    if args.verbose:
+    if verbose:
         cmd.append("--verbose")
 
+    return cmd
+
+
+def _run_analyze(args):
+    """Delegate analyze command to Rust binary."""
+    cmd = _build_analyze_cmd(
+        args.target,
+        args.input,
+        args.repeat,
+        args.timeout,
+        args.log_dir,
+        args.language,
+        getattr(args, "analysis_mode", None),
+        args.format,
+        args.verbose,
+    )
     result = subprocess.run(cmd, check=False)
     return result.returncode
 
 
+def _tail(text, max_chars):
+    """Keep only the last ``max_chars`` characters; summaries are printed last."""
+    if max_chars is None or len(text) <= max_chars:
+        return text
+    return text[-max_chars:]
+
+
+def _serve_error(session_id, error):
+    return {"session_id": session_id, "returncode": -1, "stdout": "", "stderr": "", "error": error}
+
+
+def _serve_one(request, log_dir):
+    """Run one serve-analyze request and package the captured output."""
+    if not isinstance(request, dict):
+        return _serve_error("unknown", "Invalid request: expected a JSON object")
+    session_id = request.get("session_id", "unknown")
+    timeout = 5.0
+    try:
+        target = request.get("target")
+        if not isinstance(target, str) or not target:
+            raise ValueError("Missing or invalid field: 'target' must be a non-empty string")
+        timeout = float(request.get("timeout_seconds", timeout))
+        max_chars = request.get("max_output_chars")
+        if max_chars is not None:
+            max_chars = int(max_chars)
+            if max_chars < 1:
+                raise ValueError(f"max_output_chars must be at least 1, got {max_chars}")
+        cmd = _build_analyze_cmd(
+            target,
+            request.get("inputs", []),
+            request.get("repeat", 1),
+            timeout,
+            request.get("log_dir", log_dir),
+            request.get("language"),
+            request.get("analysis_mode"),
+            request.get("format"),
+            request.get("verbose", False),
+        )
+        # Bound each request so one hung analysis cannot wedge the whole session.
+        completed = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            timeout=timeout + 15,
+            check=False,
+        )
+        return {
+            "session_id": session_id,
+            "returncode": completed.returncode,
+            "stdout": _tail(completed.stdout, max_chars),
+            "stderr": _tail(completed.stderr, max_chars),
+        }
+    except subprocess.TimeoutExpired:
+        error = f"analyze timed out after {timeout + 15:.0f}s"
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+    return _serve_error(session_id, error)
+
+
+def _run_serve_analyze(args):
+    """Answer line-delimited JSON analyze requests on stdin until EOF.
+
+    Lets harnesses pay interpreter/uv startup once instead of once per target.
+    Each request mirrors the bridge protocol fields (session_id, target,
+    language, inputs, repeat, timeout_seconds, analysis_mode, format); each response
+    is one JSON line with returncode, stdout and stderr of the analyze run.
+    An optional max_output_chars keeps only that many trailing characters of
+    each stream so verbose analyzer logs are not re-encoded and shipped back.
+    """
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as exc:
+            response = _serve_error("unknown", f"Invalid JSON input: {exc}")
+        else:
+            response = _serve_one(request, args.log_dir)
+        sys.stdout.write(json.dumps(response) + "\n")
+        sys.stdout.flush()
+    return 0
+
+
 def _run_run_all(args):
     """Delegate run-all command to Rust binary."""
     cmd = [
@@ -114,6 +217,7 @@ def main():
   uv run graphene run-all --language python
   uv run graphene run-all --generate 10
   uv run graphene list --detailed
+  uv run graphene serve-analyze < requests.jsonl
     uv run graphene clear --log-dir artifacts/logs
     uv run graphene clear --log-dir artifacts/logs --archive-csv artifacts/logs/cleared_results.csv
 """
@@ -135,6 +239,12 @@ def main():
         default="both",
         help="Analysis mode: dynamic, static, or both (default: both).",
     )
+    analyze_parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Summary format: human-readable text or a single-line JSON response (default: text).",
+    )
     analyze_parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
     
     # Run-all command
@@ -151,6 +261,13 @@ def main():
     )
     runall_parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
     
+    # Serve-analyze command
+    serve_parser = subparsers.add_parser(
+        "serve-analyze",
+        help="Serve line-delimited JSON analyze requests on stdin (one response line each)",
+    )
+    serve_parser.add_argument("--log-dir", default="artifacts/logs", help="Default output directory for reports (default: artifacts/logs)")
+
     # List command
     list_parser = subparsers.add_parser("list", help="List available analyzers")
     list_parser.add_argument("--detailed", action="store_true", help="Show detailed analyzer capabilities")
@@ -171,6 +288,8 @@ def main():
         return _run_analyze(args)
     if args.command == "run-all":
         return _run_run_all(args)
+    if args.command == "serve-analyze":
+        return _run_serve_analyze(args)
     if args.command == "list":
         return _run_list(args)
     if args.command == "clear":
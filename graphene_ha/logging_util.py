@@ -1,9 +1,13 @@
 """Logging and test reporting module."""
 
+import itertools
 import logging
 from datetime import datetime
 from pathlib import Path
 
+# Monotonic suffix for per-instance logger names; unlike id(), never reused.
+_logger_ids = itertools.count()
+
 
 class TestingLogger:
     def __init__(self, log_dir="logs", test_name=None, show_success=False, run_dir=None):
@@ -20,14 +24,22 @@ class TestingLogger:
         self._initialized = False
         self._has_vuln = False
         self.show_success = show_success
-        self.logger = logging.getLogger("EscapeTester")
+        # Per-instance logger so concurrent sessions don't share (and clobber) handlers.
+        self.logger = logging.getLogger(f"EscapeTester.{next(_logger_ids)}")
         self.logger.setLevel(logging.DEBUG)
-        self.logger.handlers.clear()
+        self.logger.propagate = False
         ch = logging.StreamHandler()
         ch.setLevel(logging.INFO)
         ch.setFormatter(logging.Formatter('[%(levelname)s] %(message)s'))
         self.logger.addHandler(ch)
 
+    def close(self):
+        """Close and detach all handlers owned by this logger, then unregister it."""
+        for handler in self.logger.handlers[:]:
+            handler.close()
+            self.logger.removeHandler(handler)
+        logging.Logger.manager.loggerDict.pop(self.logger.name, None)
+
     @staticmethod
     def _format_input_markdown(input_data):
         if not input_data:
@@ -94,19 +106,26 @@ class TestingLogger:
 
     def log_attempt(self, attempt_num, input_data, result, vulnerabilities=None, exec_time_ms=0):
         vulnerabilities = vulnerabilities or []
-        escape_detected = getattr(result, "escape_detected", False)
+        escape_detected = result.escape_detected
+        if not (self.show_success or result.crashed or vulnerabilities or escape_detected):
+            return
         status = self._format_status(result, vulnerabilities)
-        if self.show_success or result.crashed or vulnerabilities or escape_detected:
-            self.logger.info(f"[Attempt {attempt_num}] Input: {repr(input_data[:80])} | Status: {status} | Time: {exec_time_ms:.1f}ms")
+        self.logger.info(
+            "[Attempt %d] Input: %r | Status: %s | Time: %.1fms",
+            attempt_num, input_data[:80], status, exec_time_ms,
+        )
         if result.crashed:
-            self.logger.debug(f"  Crash: {result.anomaly or 'unknown'}, Error: {result.error[:200]}")
+            self.logger.debug("  Crash: %s, Error: %s", result.anomaly or "unknown", result.error[:200])
         if escape_detected:
-            self.logger.warning(f"  Escape: {self._format_escape_details(result.escape_details) or 'details unavailable'}")
+            self.logger.warning(
+                "  Escape: %s",
+                self._format_escape_details(result.escape_details) or "details unavailable",
+            )
         if vulnerabilities:
             self._has_vuln = True
             self._ensure_file_logging()
             for v in vulnerabilities:
-                self.logger.warning(f"  VULN: {v.vulnerability_type.upper()} ({v.severity})")
+                self.logger.warning("  VULN: %s (%s)", v.vulnerability_type.upper(), v.severity)
                 self._write_vulnerability(attempt_num, input_data, result, v)
             csv_row = self._to_csv_row(attempt_num, input_data, result, vulnerabilities, exec_time_ms, status)
             with open(self.details_file, 'a', encoding="utf-8") as f:
@@ -153,6 +172,7 @@ class TestingLogger:
         self.logger.info(f"Crash Rate: {report.crash_rate*100:.2f}% | Vulns: {len(report.vulnerabilities)}")
         self.logger.info("=" * 70)
         self._write_summary(report)
+        self.close()
 
     def _write_summary(self, report):
         if not self._has_vuln:
@@ -165,9 +165,10 @@ class PythonFunctionTestHarness:
                 returned_value_type="timeout",
             )
 
-        time.sleep(0.1)
+        # The child may exit before the queue's feeder thread has been drained on
+        # our side; a short blocking get avoids reporting a spurious no_response.
         try:
-            payload = result_queue.get_nowait()
+            payload = result_queue.get(timeout=0.1)
         except queue.Empty:
             return self._make_result(
                 input_data,
@@ -266,7 +267,7 @@ class PythonFunctionTestHarness:
 
     def _run_in_main_thread(self, input_data):
         """Run function in main thread."""
-        start = time.time()
+        start = time.perf_counter()
         try:
             output, returned_value = _capture_invocation(self.func, input_data, self.fixed_kwargs)
             error = ""
@@ -278,7 +279,7 @@ class PythonFunctionTestHarness:
             crashed = True
             returned_type = "exception"
 
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
 
         if elapsed > self.timeout:
             return self._make_result(
@@ -37,6 +37,14 @@ impl From<CliAnalysisMode> for AnalysisMode {
     }
 }
 
+#[derive(Debug, Clone, Copy, PartialEq, Eq, ValueEnum)]
+enum CliOutputFormat {
+    /// Human-readable summary
+    Text,
+    /// Single-line JSON analysis response
+    Json,
+}
+
 #[derive(Subcommand)]
 enum Commands {
     /// Analyze a function for object escapes
@@ -69,6 +77,10 @@ enum Commands {
         #[arg(short = 'm', long, default_value = "both")]
         analysis_mode: CliAnalysisMode,
 
+        /// Summary format printed to stdout once analysis completes
+        #[arg(long, value_enum, default_value = "text")]
+        format: CliOutputFormat,
+
         /// Enable verbose logging
         #[arg(short, long)]
         verbose: bool,
@@ -130,6 +142,7 @@ async fn main() -> Result<()> {
             output_dir,
             language,
             analysis_mode,
+            format,
             verbose,
         } => {
             orchestrator::analyze_target(
@@ -140,6 +153,7 @@ async fn main() -> Result<()> {
                 output_dir,
                 language,
                 analysis_mode.into(),
+                format == CliOutputFormat::Json,
                 verbose,
             )
             .await?;
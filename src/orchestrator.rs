@@ -78,6 +78,7 @@ pub async fn analyze_target(
     output_dir: PathBuf,
     language: Option<String>,
     analysis_mode: AnalysisMode,
+    json_output: bool,
     verbose: bool,
 ) -> Result<()> {
     init_logging(verbose);
@@ -122,7 +123,11 @@ pub async fn analyze_target(
     report_gen.generate(&response, target).await?;
 
     // Print summary
-    print_summary(&response);
+    if json_output {
+        println!("{}", serde_json::to_string(&response)?);
+    } else {
+        print_summary(&response);
+    }
 
     Ok(())
 }
@@ -5,19 +5,40 @@ Comprehensive split-case measurement using the Python function harness.
 
 from __future__ import annotations
 
+import argparse
 import importlib.util
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import NamedTuple
 
 import sys
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
 
-from graphene_ha.test_harness import PythonFunctionTestHarness
+from graphene_ha.test_harness import PythonFunctionTestHarness  # noqa: E402
 
 
 CASE_RE = re.compile(r"^case_(\d{3})_(.+)\.py$")
+TIMEOUT_RE = re.compile("timeout", re.IGNORECASE)
+
+# Per-case report rows; "prefix" is the "[idx/total] name" column.
+PREFIX_TEMPLATE = "[{idx:03d}/{total:03d}] {name:36}"
+ROW_TEMPLATE = "{prefix} {ok:4} [{bucket}] expected={expected:6} actual={actual:6}\n"
+ERROR_TEMPLATE = "{prefix} ERROR ({error})\n"
+TSV_TEMPLATE = "{idx}\t{name}\t{bucket}\n"
+
+# Confusion-matrix buckets, used as indices into the counts list.
+TP, TN, FP, FN = range(4)
+LABELS = ("TP", "TN", "FP", "FN")
+# Bucket lookup indexed as OUTCOME[expected][detected].
+OUTCOME = ((TN, FP), (FN, TP))
+# Timeouts count as detections, so oversubscribing the CPU would turn slow cases
+# into false escapes; keep the default pool small.
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
 
 
 @dataclass
@@ -27,6 +48,11 @@ class CaseDef:
     expected_escape: bool
 
 
+class CaseOutcome(NamedTuple):
+    detected: bool
+    error: str
+
+
 def expected_escape(file_path: Path) -> bool:
     return "SAFE:" not in file_path.read_text(encoding="utf-8")
 
@@ -59,64 +85,99 @@ def collect_cases(root: Path):
 
 def run_case(case: CaseDef):
     fn = load_case_function(case.file_path, case.function_name)
-    harness = PythonFunctionTestHarness(fn, timeout=3.0, prefer_main_thread=False)
+    # Run on a thread inside the pool worker itself rather than a fresh interpreter.
+    harness = PythonFunctionTestHarness(fn, timeout=3.0, prefer_thread=True)
     result = harness.run_test("sample")
-    detected = bool(result.escape_detected or (result.error and "timeout" in result.error.lower()))
-    return detected, result.error or ""
-
+    detected = bool(result.escape_detected or (result.error and TIMEOUT_RE.search(result.error)))
+    return CaseOutcome(detected=detected, error=result.error or "")
 
-def classify(expected: bool, detected: bool) -> str:
-    if expected and detected:
-        return "tp"
-    if not expected and not detected:
-        return "tn"
-    if expected and not detected:
-        return "fn"
-    return "fp"
 
+def classify(expected: bool, detected: bool) -> int:
+    return OUTCOME[expected][detected]
 
-def main():
-    root = Path(__file__).resolve().parent.parent
-    cases = collect_cases(root)
 
-    print("=" * 82)
-    print(f"COMPREHENSIVE SPLIT-CASE MEASUREMENT ({len(cases)} CASES)")
-    print("=" * 82)
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
-    counts = {"tp": 0, "tn": 0, "fp": 0, "fn": 0}
-    failures = []
 
-    for idx, case in enumerate(cases, 1):
-        print(f"[{idx:03d}/{len(cases):03d}] {case.function_name:36}", end=" ", flush=True)
-        detected, error = run_case(case)
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Comprehensive harness measurement for split Python cases")
+    parser.add_argument(
+        "--workers",
+        type=positive_int,
+        default=DEFAULT_WORKERS,
+        help=f"Worker processes used to run cases (default: {DEFAULT_WORKERS})",
+    )
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--quiet", action="store_true", help="Only print the trailing summary")
+    output.add_argument("--tsv", action="store_true", help="Only print one tab-separated record per case")
+    return parser.parse_args()
 
-        if error and "timeout" not in error.lower():
-            print(f"ERROR ({error})")
-            failures.append((case.function_name, "error", error))
-            continue
 
-        bucket = classify(case.expected_escape, detected)
-        counts[bucket] += 1
+def main():
+    args = parse_args()
+    cases = collect_cases(ROOT_DIR)
+    show_rows = not (args.quiet or args.tsv)
 
-        expected_label = "ESCAPE" if case.expected_escape else "SAFE"
-        actual_label = "ESCAPE" if detected else "SAFE"
-        ok = "PASS" if case.expected_escape == detected else "FAIL"
-        print(f"{ok:4} [{bucket.upper()}] expected={expected_label:6} actual={actual_label:6}")
+    if not args.tsv:
+        print("=" * 82)
+        print(f"COMPREHENSIVE SPLIT-CASE MEASUREMENT ({len(cases)} CASES)")
+        print("=" * 82)
 
-        if ok == "FAIL":
-            failures.append((case.function_name, bucket.upper(), f"expected={expected_label}, actual={actual_label}"))
+    counts = [0] * len(LABELS)
+    failures = []
 
-    total = sum(counts.values())
-    accuracy = ((counts["tp"] + counts["tn"]) / total) if total else 0.0
-    precision = (counts["tp"] / (counts["tp"] + counts["fp"])) if (counts["tp"] + counts["fp"]) else 0.0
-    recall = (counts["tp"] / (counts["tp"] + counts["fn"])) if (counts["tp"] + counts["fn"]) else 0.0
+    # Cases are independent, so fan them out across processes; map() yields in
+    # order, so each row is written as soon as it and its predecessors finish.
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for idx, (case, outcome) in enumerate(zip(cases, pool.map(run_case, cases)), 1):
+            prefix = PREFIX_TEMPLATE.format(idx=idx, total=len(cases), name=case.function_name)
+
+            if outcome.error and not TIMEOUT_RE.search(outcome.error):
+                if args.tsv:
+                    sys.stdout.write(TSV_TEMPLATE.format(idx=idx, name=case.function_name, bucket="ERROR"))
+                elif show_rows:
+                    sys.stdout.write(ERROR_TEMPLATE.format(prefix=prefix, error=outcome.error))
+                failures.append((case.function_name, "error", outcome.error))
+                continue
+
+            bucket = classify(case.expected_escape, outcome.detected)
+            counts[bucket] += 1
+            label = LABELS[bucket]
+
+            expected_label = "ESCAPE" if case.expected_escape else "SAFE"
+            actual_label = "ESCAPE" if outcome.detected else "SAFE"
+            ok = "PASS" if case.expected_escape == outcome.detected else "FAIL"
+            if args.tsv:
+                sys.stdout.write(TSV_TEMPLATE.format(idx=idx, name=case.function_name, bucket=label))
+            elif show_rows:
+                sys.stdout.write(
+                    ROW_TEMPLATE.format(
+                        prefix=prefix, ok=ok, bucket=label, expected=expected_label, actual=actual_label
+                    )
+                )
+
+            if ok == "FAIL":
+                failures.append((case.function_name, label, f"expected={expected_label}, actual={actual_label}"))
+
+    if args.tsv:
+        return
+
+    tp, tn, fp, fn = counts[TP], counts[TN], counts[FP], counts[FN]
+    total = tp + tn + fp + fn
+    accuracy = ((tp + tn) / total) if total else 0.0
+    precision = (tp / (tp + fp)) if (tp + fp) else 0.0
+    recall = (tp / (tp + fn)) if (tp + fn) else 0.0
     f1 = (2 * precision * recall / (precision + recall)) if (precision + recall) else 0.0
 
     print("\n" + "=" * 82)
     print("SUMMARY")
     print("=" * 82)
     print(f"Total: {total}")
-    print(f"TP: {counts['tp']}  TN: {counts['tn']}  FP: {counts['fp']}  FN: {counts['fn']}")
+    print(f"TP: {tp}  TN: {tn}  FP: {fp}  FN: {fn}")
     print(f"Accuracy:  {accuracy:.1%}")
     print(f"Precision: {precision:.1%}")
     print(f"Recall:    {recall:.1%}")
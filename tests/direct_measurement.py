@@ -7,18 +7,38 @@ from __future__ import annotations
 
 import argparse
 import importlib.util
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import NamedTuple
 
 import sys
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
 
-from graphene_ha.test_harness import PythonFunctionTestHarness
+from graphene_ha.test_harness import PythonFunctionTestHarness  # noqa: E402
 
 
 CASE_RE = re.compile(r"^case_(\d{3})_(.+)\.py$")
+TIMEOUT_RE = re.compile("timeout", re.IGNORECASE)
+
+# Per-case report rows; "prefix" is the "[idx/total] name" column.
+PREFIX_TEMPLATE = "[{idx:02d}/{total:02d}] {name:36}"
+ROW_TEMPLATE = "{prefix} {ok:4} [{bucket}] expected={expected:6} actual={actual:6}\n"
+ERROR_TEMPLATE = "{prefix} ERROR ({error})\n"
+TSV_TEMPLATE = "{idx}\t{name}\t{bucket}\n"
+
+# Confusion-matrix buckets, used as indices into the counts list.
+TP, TN, FP, FN = range(4)
+LABELS = ("TP", "TN", "FP", "FN")
+# Bucket lookup indexed as OUTCOME[expected][detected].
+OUTCOME = ((TN, FP), (FN, TP))
+# Timeouts count as detections, so oversubscribing the CPU would turn slow cases
+# into false escapes; keep the default pool small.
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
 
 
 @dataclass
@@ -28,6 +48,11 @@ class CaseDef:
     expected_escape: bool
 
 
+class CaseOutcome(NamedTuple):
+    detected: bool
+    error: str
+
+
 def expected_escape(file_path: Path) -> bool:
     return "SAFE:" not in file_path.read_text(encoding="utf-8")
 
@@ -63,56 +88,79 @@ def collect_cases(root: Path, limit: int):
 
 def run_case(case: CaseDef):
     fn = load_case_function(case.file_path, case.function_name)
-    harness = PythonFunctionTestHarness(fn, timeout=3.0, prefer_main_thread=False)
+    # Run on a thread inside the pool worker itself, so each case reuses that
+    # process instead of spawning a fresh interpreter of its own.
+    harness = PythonFunctionTestHarness(fn, timeout=3.0, prefer_thread=True)
     result = harness.run_test("sample")
-    detected = bool(result.escape_detected or (result.error and "timeout" in result.error.lower()))
-    return detected, result.error or ""
+    detected = bool(result.escape_detected or (result.error and TIMEOUT_RE.search(result.error)))
+    return CaseOutcome(detected=detected, error=result.error or "")
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def main():
     parser = argparse.ArgumentParser(description="Direct harness measurement for split Python cases")
     parser.add_argument("--limit", type=int, default=20, help="How many cases to test (default: 20)")
+    parser.add_argument(
+        "--workers",
+        type=positive_int,
+        default=DEFAULT_WORKERS,
+        help=f"Persistent worker processes used to run cases (default: {DEFAULT_WORKERS})",
+    )
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--quiet", action="store_true", help="Only print the trailing summary")
+    output.add_argument("--tsv", action="store_true", help="Only print one tab-separated record per case")
     args = parser.parse_args()
 
-    root = Path(__file__).resolve().parent.parent
-    cases = collect_cases(root, args.limit)
-
-    print("=" * 78)
-    print(f"DIRECT HARNESS MEASUREMENT ({len(cases)} CASES)")
-    print("=" * 78)
-
-    tp = tn = fp = fn = 0
-
-    for idx, case in enumerate(cases, 1):
-        print(f"[{idx:02d}/{len(cases):02d}] {case.function_name:36}", end=" ", flush=True)
-        detected, error = run_case(case)
-
-        if error and "timeout" not in error.lower():
-            print(f"ERROR ({error})")
-            continue
-
-        expected = case.expected_escape
-        if expected and detected:
-            tp += 1
-            status = "TP"
-            ok = "PASS"
-        elif not expected and not detected:
-            tn += 1
-            status = "TN"
-            ok = "PASS"
-        elif expected and not detected:
-            fn += 1
-            status = "FN"
-            ok = "FAIL"
-        else:
-            fp += 1
-            status = "FP"
-            ok = "FAIL"
-
-        expected_label = "ESCAPE" if expected else "SAFE"
-        actual_label = "ESCAPE" if detected else "SAFE"
-        print(f"{ok:4} [{status}] expected={expected_label:6} actual={actual_label:6}")
-
+    cases = collect_cases(ROOT_DIR, args.limit)
+    show_rows = not (args.quiet or args.tsv)
+
+    if not args.tsv:
+        print("=" * 78)
+        print(f"DIRECT HARNESS MEASUREMENT ({len(cases)} CASES)")
+        print("=" * 78)
+
+    counts = [0] * len(LABELS)
+
+    # Long-lived workers amortize interpreter startup and imports across all cases;
+    # map() yields in order, so each row is written as soon as it is available.
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for idx, (case, outcome) in enumerate(zip(cases, pool.map(run_case, cases)), 1):
+            prefix = PREFIX_TEMPLATE.format(idx=idx, total=len(cases), name=case.function_name)
+
+            if outcome.error and not TIMEOUT_RE.search(outcome.error):
+                if args.tsv:
+                    sys.stdout.write(TSV_TEMPLATE.format(idx=idx, name=case.function_name, bucket="ERROR"))
+                elif show_rows:
+                    sys.stdout.write(ERROR_TEMPLATE.format(prefix=prefix, error=outcome.error))
+                continue
+
+            expected = case.expected_escape
+            bucket = OUTCOME[expected][outcome.detected]
+            counts[bucket] += 1
+            status = LABELS[bucket]
+            ok = "PASS" if expected == outcome.detected else "FAIL"
+
+            expected_label = "ESCAPE" if expected else "SAFE"
+            actual_label = "ESCAPE" if outcome.detected else "SAFE"
+            if args.tsv:
+                sys.stdout.write(TSV_TEMPLATE.format(idx=idx, name=case.function_name, bucket=status))
+            elif show_rows:
+                sys.stdout.write(
+                    ROW_TEMPLATE.format(
+                        prefix=prefix, ok=ok, bucket=status, expected=expected_label, actual=actual_label
+                    )
+                )
+
+    if args.tsv:
+        return
+
+    tp, tn, fp, fn = counts[TP], counts[TN], counts[FP], counts[FN]
     total = tp + tn + fp + fn
     accuracy = ((tp + tn) / total) if total else 0.0
     precision = (tp / (tp + fp)) if (tp + fp) else 0.0
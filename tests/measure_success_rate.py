@@ -4,25 +4,52 @@ Measure escape detection quality across split case suites.
 
 All language options follow the same workflow:
 - Build target from case metadata
-- Invoke `uv run graphene analyze` with explicit language
-- Parse static summary for total escapes
+- Send it, with explicit language, to a persistent `uv run graphene serve-analyze`
+  process (one per worker thread)
+- Parse the static summary's total escapes from the `--format json` response
+  (falling back to the text summary)
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import os
 import re
 import subprocess
+import sys
+import threading
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 CASE_RE = re.compile(r"^case_(\d{3})_(.+)$")
 JAVA_CASE_RE = re.compile(r"^Case(\d{3})(.*)$")
 LANGUAGE_ORDER = ("python", "javascript", "go", "rust", "java")
+# Compiled once and matched case-insensitively, so no lowered copy of the output is made.
+TOTAL_ESCAPES_RE = re.compile(r"total escapes:\s*(\d+)", re.IGNORECASE)
+JSON_TOTAL_ESCAPES_RE = re.compile(r'"total_escapes"\s*:\s*(\d+)', re.IGNORECASE)
+DETECTED_RE = re.compile(r"detected: true", re.IGNORECASE)
+# Opt-in on-disk result cache (GRAPHENE_TEST_CACHE=1). Bump CACHE_VERSION when the
+# result format or detection logic changes to invalidate existing entries.
+CACHE_ENV = "GRAPHENE_TEST_CACHE"
+CACHE_DIR_NAME = ".graphene_ha_cache"
+CACHE_VERSION = 1
+ANALYZER_BINARIES = ("graphene-ha", "rust-analyzer")
+ANALYZER_DIRS = {"python": "python", "javascript": "nodejs", "go": "go", "rust": "rust", "java": "java"}
+# The Python bridge imports the harness and detector from the package itself.
+ANALYZER_EXTRA_GLOBS = {"python": ("graphene_ha/*.py",)}
+# Progress rows are written in batches: every PROGRESS_BATCH rows or PROGRESS_INTERVAL_S seconds.
+PROGRESS_BATCH = 5
+PROGRESS_INTERVAL_S = 0.5
+# Only the trailing summary is parsed, so don't ship full analyzer logs back.
+MAX_OUTPUT_CHARS = 64 * 1024
 
 
 @dataclass
@@ -41,6 +68,7 @@ class TestResult:
     detected_escape: bool
     elapsed_ms: float
     error: str = ""
+    cached: bool = False
 
 
 def to_camel_case(parts: List[str]) -> str:
@@ -123,7 +151,9 @@ def function_name_for_case(language: str, stem: str) -> str:
     raise ValueError(f"unsupported language: {language}")
 
 
-def collect_cases(root: Path, language: str, limit: int) -> List[TestCase]:
+@lru_cache(maxsize=None)
+def collect_cases(root: Path, language: str, limit: int) -> Tuple[TestCase, ...]:
+    # Cached (and immutable) so reporting or re-run helpers can reuse one scan per language.
     directory, pattern = case_glob(language)
     cases_dir = root / directory
     found: List[TestCase] = []
@@ -150,14 +180,34 @@ def collect_cases(root: Path, language: str, limit: int) -> List[TestCase]:
         if limit and len(found) >= limit:
             break
 
-    return found
+    return tuple(found)
+
+
+def parse_json_escapes(stdout: str) -> Optional[int]:
+    # `analyze --format json` prints the response as the last JSON line; log
+    # lines from the analyzer share stdout, so scan from the end.
+    for line in reversed(stdout.splitlines()):
+        line = line.strip()
+        if not line.startswith("{"):
+            continue
+        try:
+            response = json.loads(line)
+            # Score the static count, as the text summary did. The top-level summary
+            # is the dynamic one in "both" mode and is empty when no inputs are run.
+            static = response.get("static_analysis")
+            if static is not None:
+                return int(static["summary"]["total_escapes"])
+            return int(response["summary"]["escapes"])
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return None
+    return None
 
 
 def parse_total_escapes(output: str) -> Optional[int]:
-    match = re.search(r"total escapes:\s*(\d+)", output, flags=re.IGNORECASE)
+    match = TOTAL_ESCAPES_RE.search(output)
     if match:
         return int(match.group(1))
-    match = re.search(r'"total_escapes"\s*:\s*(\d+)', output, flags=re.IGNORECASE)
+    match = JSON_TOTAL_ESCAPES_RE.search(output)
     if match:
         return int(match.group(1))
     return None
@@ -174,54 +224,154 @@ def compact_error(output: str, fallback: str) -> str:
     return fallback
 
 
-def detect_escape_with_cli(root: Path, case: TestCase, timeout_seconds: int) -> TestResult:
-    started = time.time()
-    target = f"{case.target_file}:{case.function_name}"
+class AnalyzeServer:
+    """Long-lived `graphene serve-analyze` process speaking line-delimited JSON."""
 
-    try:
-        completed = subprocess.run(
-            [
-                "uv",
-                "run",
-                "graphene",
-                "analyze",
-                target,
-                "--language",
-                case.language,
-                "--repeat",
-                "1",
-                "--timeout",
-                str(timeout_seconds),
-            ],
+    def __init__(self, root: Path):
+        self._proc = subprocess.Popen(
+            ["uv", "run", "graphene", "serve-analyze"],
             cwd=root,
-            capture_output=True,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
             text=True,
             encoding="utf-8",
             errors="replace",
-            timeout=timeout_seconds + 15,
+            bufsize=1,
+        )
+
+    @property
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def analyze(self, request: dict) -> dict:
+        # serve-analyze bounds every request itself, so a response line always follows.
+        self._proc.stdin.write(json.dumps(request) + "\n")
+        self._proc.stdin.flush()
+        line = self._proc.stdout.readline()
+        if not line:
+            raise RuntimeError(f"serve-analyze exited with code {self._proc.poll()}")
+        return json.loads(line)
+
+    def close(self) -> None:
+        self._proc.stdin.close()
+        try:
+            self._proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+
+
+_thread_servers = threading.local()
+_all_servers: List[AnalyzeServer] = []
+_servers_lock = threading.Lock()
+
+
+def analyze_server(root: Path) -> AnalyzeServer:
+    """Return this thread's analyze server, starting (or restarting) it as needed."""
+    server = getattr(_thread_servers, "server", None)
+    if server is None or not server.alive:
+        server = AnalyzeServer(root)
+        _thread_servers.server = server
+        with _servers_lock:
+            _all_servers.append(server)
+    return server
+
+
+def close_analyze_servers() -> None:
+    with _servers_lock:
+        for server in _all_servers:
+            server.close()
+        _all_servers.clear()
+
+
+def detect_escape_with_cli(root: Path, case: TestCase, timeout_seconds: int) -> TestResult:
+    started = time.perf_counter_ns()
+    target = f"{case.target_file}:{case.function_name}"
+
+    try:
+        response = analyze_server(root).analyze(
+            {
+                "session_id": f"measure_{case.function_name}",
+                "language": case.language,
+                "target": target,
+                "inputs": [],
+                "repeat": 1,
+                "timeout_seconds": timeout_seconds,
+                "format": "json",
+                "max_output_chars": MAX_OUTPUT_CHARS,
+            }
         )
+        if response.get("error"):
+            raise RuntimeError(response["error"])
 
-        output = f"{completed.stdout}\n{completed.stderr}"
-        parsed_total = parse_total_escapes(output)
+        output = f"{response['stdout']}\n{response['stderr']}"
+        parsed_total = parse_json_escapes(response["stdout"])
+        if parsed_total is None:
+            parsed_total = parse_total_escapes(output)
 
         if parsed_total is not None:
             detected = parsed_total > 0
         else:
-            lowered = output.lower()
-            detected = "detected: true" in lowered
+            detected = DETECTED_RE.search(output) is not None
 
         error = ""
-        if completed.returncode != 0:
-            error = compact_error(output, f"analyze failed with exit code {completed.returncode}")
+        if response["returncode"] != 0:
+            error = compact_error(output, f"analyze failed with exit code {response['returncode']}")
 
         return TestResult(
             case=case,
             detected_escape=detected,
-            elapsed_ms=(time.time() - started) * 1000.0,
+            elapsed_ms=(time.perf_counter_ns() - started) / 1_000_000.0,
             error=error,
         )
     except Exception as exc:
-        return TestResult(case=case, detected_escape=False, elapsed_ms=(time.time() - started) * 1000.0, error=str(exc))
+        return TestResult(case=case, detected_escape=False, elapsed_ms=(time.perf_counter_ns() - started) / 1_000_000.0, error=str(exc))
+
+
+@lru_cache(maxsize=None)
+def analyzer_stamp(root: Path, language: str) -> int:
+    # Newest mtime across the orchestrator binaries and the language's bridge and
+    # static analyzer sources, which is where the verdict actually comes from.
+    paths = [root / "target" / "release" / name for name in ANALYZER_BINARIES]
+    for path in (root / "analyzers" / ANALYZER_DIRS[language]).rglob("*"):
+        if path.is_file() and "__pycache__" not in path.parts:
+            paths.append(path)
+    for pattern in ANALYZER_EXTRA_GLOBS.get(language, ()):
+        paths.extend(root.glob(pattern))
+    return max((path.stat().st_mtime_ns for path in paths if path.exists()), default=0)
+
+
+def cache_key(root: Path, case: TestCase, timeout_seconds: int) -> str:
+    # Rebuilding or editing any analyzer, or touching the case source, invalidates the entry.
+    source_mtime = (root / case.target_file).stat().st_mtime_ns
+    raw = (
+        f"{CACHE_VERSION}:{case.language}:{case.target_file}:{case.function_name}:"
+        f"{timeout_seconds}:{source_mtime}:{analyzer_stamp(root, case.language)}"
+    )
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def detect_escape_cached(root: Path, case: TestCase, timeout_seconds: int) -> TestResult:
+    if os.environ.get(CACHE_ENV) != "1":
+        return detect_escape_with_cli(root, case, timeout_seconds)
+
+    cache_file = root / CACHE_DIR_NAME / f"{cache_key(root, case, timeout_seconds)}.json"
+    try:
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        return TestResult(
+            case=case, detected_escape=cached["detected_escape"], elapsed_ms=cached["elapsed_ms"], cached=True
+        )
+    except (OSError, ValueError, KeyError):
+        pass
+
+    result = detect_escape_with_cli(root, case, timeout_seconds)
+    # Errors are often transient (timeouts, missing toolchains), so only cache clean runs.
+    if not result.error:
+        cache_file.parent.mkdir(exist_ok=True)
+        cache_file.write_text(
+            json.dumps({"detected_escape": result.detected_escape, "elapsed_ms": result.elapsed_ms}),
+            encoding="utf-8",
+        )
+    return result
 
 
 def classify(result: TestResult) -> str:
@@ -236,15 +386,17 @@ def classify(result: TestResult) -> str:
     return "fp"
 
 
-def print_summary(results: List[TestResult]) -> None:
-    buckets: Dict[str, Dict[str, int]] = defaultdict(lambda: {"tp": 0, "tn": 0, "fp": 0, "fn": 0, "total": 0})
+def new_buckets() -> Dict[str, Dict[str, int]]:
+    return defaultdict(lambda: {"tp": 0, "tn": 0, "fp": 0, "fn": 0, "total": 0})
 
-    for result in results:
-        key = result.case.language
-        tag = classify(result)
-        buckets[key][tag] += 1
-        buckets[key]["total"] += 1
 
+def tally(buckets: Dict[str, Dict[str, int]], result: TestResult) -> None:
+    stats = buckets[result.case.language]
+    stats[classify(result)] += 1
+    stats["total"] += 1
+
+
+def print_summary(buckets: Dict[str, Dict[str, int]]) -> None:
     print("\n" + "=" * 88)
     print("SUMMARY")
     print("=" * 88)
@@ -266,11 +418,31 @@ def print_summary(results: List[TestResult]) -> None:
         print(f"{language:12} {total:7} {tp:4} {tn:4} {fp:4} {fn:4} {accuracy:9.1%} {precision:9.1%} {recall:7.1%}")
 
 
+def flush_progress(progress: List[str]) -> None:
+    if progress:
+        sys.stdout.write("".join(progress))
+        sys.stdout.flush()
+        progress.clear()
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Measure split-case escape detection success rate")
     parser.add_argument("--language", choices=["all", *LANGUAGE_ORDER], default="all")
     parser.add_argument("--limit", type=int, default=0, help="Limit test cases per language (0 = all)")
     parser.add_argument("--timeout", type=int, default=5, help="Per-test timeout seconds")
+    parser.add_argument(
+        "--jobs",
+        type=positive_int,
+        default=min(os.cpu_count() or 1, 8),
+        help="Concurrent analyzer invocations (default: min(CPU count, 8))",
+    )
     return parser.parse_args()
 
 
@@ -291,22 +463,38 @@ def main() -> None:
     print(f"Running {len(selected)} split-case tests")
     print("=" * 88)
 
-    results: List[TestResult] = []
-    for index, case in enumerate(selected, 1):
-        print(f"[{index:03d}/{len(selected):03d}] {case.language:10} {case.function_name:32}", end=" ", flush=True)
-        result = detect_escape_with_cli(root, case, args.timeout)
-        results.append(result)
-
-        if result.error:
-            print(f"ERROR ({result.error})")
-            continue
-
-        expected = "ESCAPE" if case.expected_escape else "SAFE"
-        actual = "ESCAPE" if result.detected_escape else "SAFE"
-        status = "PASS" if case.expected_escape == result.detected_escape else "FAIL"
-        print(f"{status:4} expected={expected:6} actual={actual:6} time={result.elapsed_ms:7.1f}ms")
-
-    print_summary(results)
+    # Results are tallied as they are reported, so the summary needs no second pass.
+    buckets = new_buckets()
+    progress: List[str] = []
+    last_flush = time.perf_counter()
+    # Each worker thread drives its own serve-analyze process, so threads are enough to overlap them.
+    # map() yields in submission order, which keeps the progress listing stable.
+    try:
+        with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+            completed = pool.map(lambda case: detect_escape_cached(root, case, args.timeout), selected)
+            for index, (case, result) in enumerate(zip(selected, completed), 1):
+                prefix = f"[{index:03d}/{len(selected):03d}] {case.language:10} {case.function_name:32}"
+                tally(buckets, result)
+
+                if result.error:
+                    progress.append(f"{prefix} ERROR ({result.error})\n")
+                else:
+                    expected = "ESCAPE" if case.expected_escape else "SAFE"
+                    actual = "ESCAPE" if result.detected_escape else "SAFE"
+                    status = "PASS" if case.expected_escape == result.detected_escape else "FAIL"
+                    progress.append(
+                        f"{prefix} {status:4} expected={expected:6} actual={actual:6} time={result.elapsed_ms:7.1f}ms{' (cached)' if result.cached else ''}\n"
+                    )
+
+                now = time.perf_counter()
+                if len(progress) >= PROGRESS_BATCH or now - last_flush >= PROGRESS_INTERVAL_S:
+                    flush_progress(progress)
+                    last_flush = now
+    finally:
+        flush_progress(progress)
+        close_analyze_servers()
+
+    print_summary(buckets)
 
 
 if __name__ == "__main__":
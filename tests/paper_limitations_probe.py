@@ -56,7 +56,7 @@ def compact_error(output: str, fallback: str) -> str:
 
 
 def detect_escape(root: Path, case: PaperCase, timeout_seconds: int = 8) -> tuple[bool, bool, str, float]:
-    started = time.time()
+    started = time.perf_counter_ns()
     completed = subprocess.run(
         [
             "uv",
@@ -92,7 +92,7 @@ def detect_escape(root: Path, case: PaperCase, timeout_seconds: int = 8) -> tupl
     else:
         detected_escape = "escape_detected: true" in output.lower() or "escapes detected: 1" in output.lower()
 
-    elapsed_ms = (time.time() - started) * 1000.0
+    elapsed_ms = (time.perf_counter_ns() - started) / 1_000_000.0
 
     detail = ""
     if completed.returncode != 0:
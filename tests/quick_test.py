@@ -5,91 +5,312 @@ Quick smoke test for the split 200+ case suites.
 This script samples a few Python and Node.js cases and reports classifier accuracy.
 """
 
+import asyncio
+import hashlib
 import json
-import subprocess
+import os
+import re
 import sys
-from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None
+
 
 WORKSPACE = Path(__file__).parent.parent
+# Requests sent to one analyzer_bridge.js / serve-analyze process at a time.
+BATCH_SIZE = 16
+# Python targets are analyzed with a short timeout first and retried with the
+# full one only when the first run produced no verdict or hit that timeout.
+FAST_TIMEOUT_S = 1
+FULL_TIMEOUT_S = 3
+DECIDED_RE = re.compile(r"detected:|escapes", re.IGNORECASE)
+# A run that hit the fast timeout has no trustworthy verdict and is retried.
+TIMED_OUT_RE = re.compile(r"timeouts:\s*[1-9]", re.IGNORECASE)
+# Seconds allowed per serve-analyze response; the first one also pays for the
+# cold `uv run` start and any first-run cargo build.
+RESPONSE_TIMEOUT_S = 40
+COLD_START_TIMEOUT_S = 300
+# Upper bound on one response line read from a child process.
+MAX_LINE_BYTES = 16 * 1024 * 1024
+# Opt-in on-disk result cache (GRAPHENE_TEST_CACHE=1), shared directory with
+# measure_success_rate.py. Bump CACHE_VERSION to invalidate existing entries.
+CACHE_ENV = "GRAPHENE_TEST_CACHE"
+CACHE_FILE = WORKSPACE / ".graphene_ha_cache" / "quick_test.json"
+CACHE_VERSION = 1
+# Files (or glob patterns) whose modification invalidates cached results for each language.
+ANALYZER_FILES = {
+    "python": (
+        "target/release/graphene-ha",
+        "analyzers/python/analyzer_bridge.py",
+        "analyzers/python/static_analyzer.py",
+        "graphene_ha/*.py",
+    ),
+    "javascript": ("analyzers/nodejs/analyzer_bridge.js", "analyzers/nodejs/static_analyzer.js"),
+}
+
+
+# Bridge responses can be large; use orjson's C codec when it is installed.
+if orjson is not None:
+    def dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
 
-# (language, target_file, function_name, should_detect_escape)
-TESTS = [
-    ("python", "tests/python/cases/case_001_cache_profile.py", "case_001_cache_profile", True),
-    ("python", "tests/python/cases/case_005_cache_ticket.py", "case_005_cache_ticket", False),
-    ("python", "tests/python/cases/case_014_publish_shipment.py", "case_014_publish_shipment", True),
-    ("python", "tests/python/cases/case_020_stage_ledger.py", "case_020_stage_ledger", False),
-    ("javascript", "tests/nodejs/cases/case_001_cache_profile.js", "case001CacheProfile", True),
-    ("javascript", "tests/nodejs/cases/case_005_cache_ticket.js", "case005CacheTicket", False),
-    ("javascript", "tests/nodejs/cases/case_014_publish_shipment.js", "case014PublishShipment", True),
-    ("javascript", "tests/nodejs/cases/case_020_stage_ledger.js", "case020StageLedger", False),
+    loads = orjson.loads
+else:
+    dumps = json.dumps
+    loads = json.loads
+
+
+# (target_file, function_name, should_detect_escape)
+PY_TESTS = [
+    ("tests/python/cases/case_001_cache_profile.py", "case_001_cache_profile", True),
+    ("tests/python/cases/case_005_cache_ticket.py", "case_005_cache_ticket", False),
+    ("tests/python/cases/case_014_publish_shipment.py", "case_014_publish_shipment", True),
+    ("tests/python/cases/case_020_stage_ledger.py", "case_020_stage_ledger", False),
+]
+JS_TESTS = [
+    ("tests/nodejs/cases/case_001_cache_profile.js", "case001CacheProfile", True),
+    ("tests/nodejs/cases/case_005_cache_ticket.js", "case005CacheTicket", False),
+    ("tests/nodejs/cases/case_014_publish_shipment.js", "case014PublishShipment", True),
+    ("tests/nodejs/cases/case_020_stage_ledger.js", "case020StageLedger", False),
 ]
+SUITES = (("python", PY_TESTS), ("javascript", JS_TESTS))
 
+# Escape verdict in analyze output: an explicit "detected: true", or a non-zero
+# escape count such as "Total Escapes: 2" / "genuine_escapes": 1.
+DETECT_RE = re.compile(r'detected:\s*true|escapes"?[:\s]+[1-9]', re.IGNORECASE)
 
-def detect_python_escape(target_file: str, function_name: str):
-    target = f"{target_file}:{function_name}"
+# Per-language stats are flat int lists indexed by these positions.
+COUNTERS = ("total", "correct", "tp", "tn", "fp", "fn")
+TOTAL, CORRECT, TP, TN, FP, FN = range(len(COUNTERS))
+# Confusion-matrix slot indexed as OUTCOME[expected][detected].
+OUTCOME = ((TN, FP), (FN, TP))
+
+
+def output_reports_escape(stdout, stderr):
+    """Apply the analyze-output escape heuristic to both captured streams."""
+    return DETECT_RE.search(stdout) is not None or DETECT_RE.search(stderr) is not None
+
+
+async def run_ndjson_batch(cmd, requests, timeout, first_timeout=None):
+    """Stream JSON-line requests to one child process; return responses keyed by session_id.
+
+    Each response must arrive within `timeout` seconds of the previous one; the
+    first may take `first_timeout` seconds instead, to cover startup. When
+    the child stalls it is killed and the responses received so far are returned,
+    so one hung target does not discard the rest of the batch.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+        cwd=WORKSPACE,
+        limit=MAX_LINE_BYTES,
+    )
+    payload = "".join(dumps(request) + "\n" for request in requests).encode("utf-8")
     try:
-        result = subprocess.run(
-            ["uv", "run", "graphene", "analyze", target, "--repeat", "1", "--timeout", "3"],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            timeout=40,
-            cwd=WORKSPACE,
-        )
+        proc.stdin.write(payload)
+        await proc.stdin.drain()
+        proc.stdin.close()
+    except (BrokenPipeError, ConnectionResetError):
+        pass
+
+    # One response per line; match on session_id since targets may print too. Both
+    # json and orjson parse bytes, so lines are never decoded separately.
+    responses = {}
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + (first_timeout or timeout)
+    while len(responses) < len(requests):
+        try:
+            line = await asyncio.wait_for(proc.stdout.readline(), max(deadline - loop.time(), 0))
+        except asyncio.TimeoutError:
+            print(f"{Path(cmd[0]).name}: no reply within {timeout}s, keeping {len(responses)} responses", file=sys.stderr)
+            proc.kill()
+            break
+        if not line:
+            break
+        try:
+            response = loads(line)
+            responses[response["session_id"]] = response
+        except Exception:
+            continue
+        deadline = loop.time() + timeout
+    await proc.wait()
+    return responses
+
+
+async def serve_analyze(targets, timeout_seconds):
+    """Send (target_file, function_name) pairs to one graphene serve-analyze process.
+
+    Returns the responses keyed by session_id; raises if the process cannot be run.
+    """
+    requests = [
+        {
+            "session_id": f"quick_{function_name}",
+            "target": f"{target_file}:{function_name}",
+            "repeat": 1,
+            "timeout_seconds": timeout_seconds,
+        }
+        for target_file, function_name in targets
+    ]
+    return await run_ndjson_batch(
+        ["uv", "run", "graphene", "serve-analyze"],
+        requests,
+        timeout=RESPONSE_TIMEOUT_S,
+        first_timeout=COLD_START_TIMEOUT_S,
+    )
+
+
+def is_decided(response):
+    """True when a response carries an analysis verdict worth trusting."""
+    if response is None or response.get("error"):
+        return False
+    if TIMED_OUT_RE.search(response["stdout"]) or TIMED_OUT_RE.search(response["stderr"]):
+        return False
+    return DECIDED_RE.search(response["stdout"]) is not None or DECIDED_RE.search(response["stderr"]) is not None
+
+
+async def detect_python_escapes(targets):
+    """Analyze (target_file, function_name) pairs through graphene serve-analyze.
+
+    Everything is first analyzed with FAST_TIMEOUT_S; only targets whose output
+    is ambiguous are retried with FULL_TIMEOUT_S. Returns a dict mapping
+    function_name to the detection result (None on error).
+    """
+    try:
+        responses = await serve_analyze(targets, FAST_TIMEOUT_S)
     except Exception as exc:
-        print(f"python error for {target}: {exc}", file=sys.stderr)
-        return None
+        print(f"python fast pass failed for batch of {len(targets)}, retrying all: {exc}", file=sys.stderr)
+        responses = {}
+    retry = [target for target in targets if not is_decided(responses.get(f"quick_{target[1]}"))]
 
-    output = f"{result.stdout}\n{result.stderr}".lower()
-    return "detected: true" in output or "escapes" in output and "1" in output
+    failed = set()
+    if retry:
+        try:
+            responses.update(await serve_analyze(retry, FULL_TIMEOUT_S))
+        except Exception as exc:
+            print(f"python error for batch of {len(retry)}: {exc}", file=sys.stderr)
+            failed = {function_name for _, function_name in retry}
+
+    detected = {}
+    for target_file, function_name in targets:
+        response = None if function_name in failed else responses.get(f"quick_{function_name}")
+        if response is None or response.get("error"):
+            if function_name not in failed:
+                error = response["error"] if response else "no response"
+                print(f"python error for {target_file}:{function_name}: {error}", file=sys.stderr)
+            detected[function_name] = None
+            continue
+        detected[function_name] = output_reports_escape(response["stdout"], response["stderr"])
+    return detected
 
 
-def detect_node_escape(target_file: str, function_name: str):
-    target = f"{target_file}:{function_name}"
-    request = {
-        "session_id": f"quick_{function_name}",
-        "language": "javascript",
-        "target": target,
-        "inputs": ["sample"],
-        "repeat": 1,
-        "timeout_seconds": 3,
-    }
+async def detect_node_escapes(targets):
+    """Analyze (target_file, function_name) pairs through one NDJSON analyzer_bridge.js process.
 
+    Returns a dict mapping function_name to the detection result (None on error).
+    """
+    requests = [
+        {
+            "session_id": f"quick_{function_name}",
+            "language": "javascript",
+            "target": f"{target_file}:{function_name}",
+            "inputs": ["sample"],
+            "repeat": 1,
+            "timeout_seconds": 3,
+        }
+        for target_file, function_name in targets
+    ]
     try:
-        result = subprocess.run(
-            ["node", "analyzers/nodejs/analyzer_bridge.js"],
-            input=json.dumps(request),
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            timeout=40,
-            cwd=WORKSPACE,
+        responses = await run_ndjson_batch(
+            ["node", "analyzers/nodejs/analyzer_bridge.js", "--ndjson"], requests, timeout=40
         )
     except Exception as exc:
-        print(f"node error for {target}: {exc}", file=sys.stderr)
-        return None
+        print(f"node error for batch of {len(targets)}: {exc}", file=sys.stderr)
+        return {}
+
+    detected = {}
+    for _, function_name in targets:
+        response = responses.get(f"quick_{function_name}")
+        if response is None:
+            detected[function_name] = None
+            continue
+        detected[function_name] = response.get("summary", {}).get("escapes", 0) > 0
+    return detected
+
+
+async def detect_all(pending):
+    """Run every pending batch concurrently; each batch owns one long-lived child process."""
+    detectors = {"python": detect_python_escapes, "javascript": detect_node_escapes}
+    jobs = [
+        (language, detectors[language](targets[offset:offset + BATCH_SIZE]))
+        for language, targets in pending.items()
+        for offset in range(0, len(targets), BATCH_SIZE)
+    ]
+    outcomes = await asyncio.gather(*(job for _, job in jobs))
+    results = {language: {} for language in pending}
+    for (language, _), outcome in zip(jobs, outcomes):
+        results[language].update(outcome)
+    return results
+
+
+# Both are looked up once per test but only change between runs, so memoize them.
+@lru_cache(maxsize=None)
+def analyzer_stamp(language):
+    stamps = []
+    for pattern in ANALYZER_FILES[language]:
+        paths = sorted(WORKSPACE.glob(pattern))
+        stamps.extend(str(path.stat().st_mtime_ns) for path in paths)
+        if not paths:
+            stamps.append("0")
+    return ":".join(stamps)
+
+
+@lru_cache(maxsize=None)
+def file_hash(target_file):
+    return hashlib.sha256((WORKSPACE / target_file).read_bytes()).hexdigest()
+
+
+def cache_key(language, target_file, function_name):
+    raw = f"{CACHE_VERSION}:{language}:{function_name}:{file_hash(target_file)}:{analyzer_stamp(language)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
+
+def load_cache():
     try:
-        response = json.loads(result.stdout)
-        return response.get("summary", {}).get("escapes", 0) > 0
-    except Exception:
-        output = f"{result.stdout}\n{result.stderr}".lower()
-        return "escape" in output and "0" not in output
+        return json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache):
+    CACHE_FILE.parent.mkdir(exist_ok=True)
+    CACHE_FILE.write_text(json.dumps(cache, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def format_summary_row(label, bucket):
+    accuracy = 100.0 * bucket[CORRECT] / bucket[TOTAL]
+    return (
+        f"{label:12} {bucket[CORRECT]:7} {bucket[TOTAL]:7} {accuracy:9.1f}%"
+        f" {bucket[TP]:4} {bucket[TN]:4} {bucket[FP]:4} {bucket[FN]:4}"
+    )
+
 
+def classify_and_report(bucket, expected, detected):
+    """Record one decided result in its language bucket and return the report text."""
+    ok = detected == expected
+    bucket[TOTAL] += 1
+    bucket[CORRECT] += ok
+    bucket[OUTCOME[expected][detected]] += 1
 
-def update_counts(bucket, expected, detected):
-    if expected and detected:
-        bucket["tp"] += 1
-    elif not expected and not detected:
-        bucket["tn"] += 1
-    elif expected and not detected:
-        bucket["fn"] += 1
-    else:
-        bucket["fp"] += 1
+    expected_s = "ESCAPE" if expected else "SAFE"
+    actual_s = "ESCAPE" if detected else "SAFE"
+    outcome = "PASS" if ok else "FAIL"
+    return f"{outcome:4} expected={expected_s:6} actual={actual_s:6}"
 
 
 def main():
@@ -97,60 +318,60 @@ def main():
     print("SPLIT-CASE QUICK TEST")
     print("=" * 72)
 
-    stats = defaultdict(lambda: {"total": 0, "correct": 0, "tp": 0, "tn": 0, "fp": 0, "fn": 0})
+    stats = {language: [0] * len(COUNTERS) for language, _ in SUITES}
+    use_cache = os.environ.get(CACHE_ENV) == "1"
+    cache = load_cache() if use_cache else {}
+    keys = {}
+    results = {"python": {}, "javascript": {}}
+    pending = {"python": [], "javascript": []}
+    for language, tests in SUITES:
+        for target_file, function_name, _ in tests:
+            if use_cache:
+                keys[function_name] = cache_key(language, target_file, function_name)
+                if keys[function_name] in cache:
+                    results[language][function_name] = cache[keys[function_name]]
+                    continue
+            pending[language].append((target_file, function_name))
 
-    for language, target_file, function_name, expected in TESTS:
-        label = f"{function_name} ({language})"
-        print(f"{label:50}", end=" ", flush=True)
+    # Every check is a subprocess wait, so overlap them all and report in suite order.
+    for language, detected in asyncio.run(detect_all(pending)).items():
+        results[language].update(detected)
 
-        if language == "python":
-            detected = detect_python_escape(target_file, function_name)
-        else:
-            detected = detect_node_escape(target_file, function_name)
+    if use_cache:
+        for language in results:
+            for function_name, detected in results[language].items():
+                if detected is not None:
+                    cache[keys[function_name]] = detected
+        save_cache(cache)
 
-        if detected is None:
-            print("ERROR")
-            continue
+    for language, tests in SUITES:
+        for _, function_name, expected in tests:
+            label = f"{function_name} ({language})"
+            print(f"{label:50}", end=" ")
+
+            detected = results[language].get(function_name)
 
-        ok = detected == expected
-        stats[language]["total"] += 1
-        stats[language]["correct"] += int(ok)
-        update_counts(stats[language], expected, detected)
+            if detected is None:
+                print("ERROR")
+                continue
 
-        expected_s = "ESCAPE" if expected else "SAFE"
-        actual_s = "ESCAPE" if detected else "SAFE"
-        outcome = "PASS" if ok else "FAIL"
-        print(f"{outcome:4} expected={expected_s:6} actual={actual_s:6}")
+            print(classify_and_report(stats[language], expected, detected))
 
     print("\n" + "=" * 72)
     print(f"{'Language':12} {'Correct':>7} {'Total':>7} {'Accuracy':>10} {'TP':>4} {'TN':>4} {'FP':>4} {'FN':>4}")
     print("-" * 72)
 
-    total_correct = 0
-    total_cases = 0
-    total = {"tp": 0, "tn": 0, "fp": 0, "fn": 0}
-
-    for language in ("python", "javascript"):
+    total = [0] * len(COUNTERS)
+    for language, _ in SUITES:
         bucket = stats[language]
-        if bucket["total"] == 0:
+        if bucket[TOTAL] == 0:
             continue
-        accuracy = 100.0 * bucket["correct"] / bucket["total"]
-        print(
-            f"{language:12} {bucket['correct']:7} {bucket['total']:7} {accuracy:9.1f}%"
-            f" {bucket['tp']:4} {bucket['tn']:4} {bucket['fp']:4} {bucket['fn']:4}"
-        )
-        total_correct += bucket["correct"]
-        total_cases += bucket["total"]
-        for key in total:
-            total[key] += bucket[key]
+        print(format_summary_row(language, bucket))
+        total = [running + count for running, count in zip(total, bucket)]
 
-    if total_cases:
-        accuracy = 100.0 * total_correct / total_cases
+    if total[TOTAL]:
         print("-" * 72)
-        print(
-            f"{'TOTAL':12} {total_correct:7} {total_cases:7} {accuracy:9.1f}%"
-            f" {total['tp']:4} {total['tn']:4} {total['fp']:4} {total['fn']:4}"
-        )
+        print(format_summary_row("TOTAL", total))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,97 @@
+"""Tests for the serve-analyze wire protocol in graphene_ha.cli."""
+
+import io
+import json
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+
+from graphene_ha import cli
+
+
+@pytest.fixture
+def fake_run(monkeypatch):
+    """Stub the Rust binary so requests never leave the process."""
+    calls = []
+
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        stdout = "log line\n  Total Escapes: 1\n"
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr="")
+
+    monkeypatch.setattr(cli, "_ensure_rust_binary", lambda: "graphene-ha")
+    monkeypatch.setattr(cli.subprocess, "run", run)
+    return calls
+
+
+def serve(monkeypatch, capsys, lines):
+    monkeypatch.setattr(cli.sys, "stdin", io.StringIO("".join(line + "\n" for line in lines)))
+    assert cli._run_serve_analyze(SimpleNamespace(log_dir="logs")) == 0
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_valid_request_returns_captured_output(fake_run):
+    request = {"session_id": "s1", "target": "case.py:fn", "timeout_seconds": 2}
+    response = cli._serve_one(request, "logs")
+    assert response == {
+        "session_id": "s1",
+        "returncode": 0,
+        "stdout": "log line\n  Total Escapes: 1\n",
+        "stderr": "",
+    }
+    assert fake_run[0][:4] == ["graphene-ha", "analyze", "--target", "case.py:fn"]
+
+
+def test_max_output_chars_keeps_the_tail(fake_run):
+    response = cli._serve_one({"target": "case.py:fn", "max_output_chars": 19}, "logs")
+    assert response["stdout"] == "  Total Escapes: 1\n"
+
+
+@pytest.mark.parametrize("max_chars", [0, -2, "many"])
+def test_bad_max_output_chars_is_rejected(fake_run, max_chars):
+    response = cli._serve_one({"target": "case.py:fn", "max_output_chars": max_chars}, "logs")
+    assert response["returncode"] == -1
+    assert response["error"].startswith("ValueError:")
+    assert fake_run == []
+
+
+@pytest.mark.parametrize("request_body", [{}, {"target": ""}, {"target": 5}, {"target": None}])
+def test_missing_or_invalid_target_is_rejected(fake_run, request_body):
+    response = cli._serve_one({"session_id": "s2", **request_body}, "logs")
+    assert response["session_id"] == "s2"
+    assert "'target'" in response["error"]
+    assert fake_run == []
+
+
+@pytest.mark.parametrize("timeout", ["fast", None, [1]])
+def test_bad_timeout_seconds_is_rejected(fake_run, timeout):
+    response = cli._serve_one({"target": "case.py:fn", "timeout_seconds": timeout}, "logs")
+    assert response["returncode"] == -1
+    assert response["error"]
+    assert fake_run == []
+
+
+def test_analyze_timeout_is_reported(monkeypatch):
+    def run(cmd, **kwargs):
+        raise subprocess.TimeoutExpired(cmd, kwargs["timeout"])
+
+    monkeypatch.setattr(cli, "_ensure_rust_binary", lambda: "graphene-ha")
+    monkeypatch.setattr(cli.subprocess, "run", run)
+    request = {"session_id": "s3", "target": "case.py:fn", "timeout_seconds": 1}
+    response = cli._serve_one(request, "logs")
+    assert response["error"] == "analyze timed out after 16s"
+
+
+def test_bad_lines_do_not_end_the_session(fake_run, monkeypatch, capsys):
+    responses = serve(
+        monkeypatch,
+        capsys,
+        ["[1]", "null", "{not json", "", '{"session_id": "ok", "target": "case.py:fn"}'],
+    )
+    assert [response["session_id"] for response in responses] == ["unknown"] * 3 + ["ok"]
+    assert responses[0]["error"] == "Invalid request: expected a JSON object"
+    assert responses[1]["error"] == "Invalid request: expected a JSON object"
+    assert responses[2]["error"].startswith("Invalid JSON input:")
+    assert "error" not in responses[3]
+    assert len(fake_run) == 1
@@ -0,0 +1,61 @@
+"""Tests for TestingLogger's per-instance logger lifecycle."""
+
+import logging
+from types import SimpleNamespace
+
+from graphene_ha import logging_util
+
+
+def make_report():
+    return SimpleNamespace(
+        total_tests=1, crashes=0, successes=1, escapes=0, crash_rate=0.0, vulnerabilities=[]
+    )
+
+
+def test_instances_do_not_share_output(tmp_path, capsys):
+    first = logging_util.TestingLogger(log_dir=tmp_path, test_name="first")
+    second = logging_util.TestingLogger(log_dir=tmp_path, test_name="second")
+    try:
+        first.logger.info("only once")
+        assert capsys.readouterr().err.count("only once") == 1
+    finally:
+        first.close()
+        second.close()
+
+
+def test_session_end_stops_output(tmp_path, capsys):
+    tester = logging_util.TestingLogger(log_dir=tmp_path, test_name="closing")
+    tester.log_session_end(make_report())
+    capsys.readouterr()
+
+    tester.logger.info("after close")
+    assert "after close" not in capsys.readouterr().err
+
+
+def test_closed_loggers_are_not_retained(tmp_path):
+    before = len(logging.Logger.manager.loggerDict)
+    for index in range(20):
+        logging_util.TestingLogger(log_dir=tmp_path, test_name=f"run_{index}").close()
+    assert len(logging.Logger.manager.loggerDict) == before
+
+
+def test_new_instance_starts_without_stale_handlers(tmp_path, capsys):
+    for index in range(5):
+        logging_util.TestingLogger(log_dir=tmp_path, test_name=f"stale_{index}").close()
+    tester = logging_util.TestingLogger(log_dir=tmp_path, test_name="fresh")
+    try:
+        tester.logger.info("fresh line")
+        assert capsys.readouterr().err.count("fresh line") == 1
+    finally:
+        tester.close()
+
+
+def test_logging_disable_applies(tmp_path, capsys):
+    tester = logging_util.TestingLogger(log_dir=tmp_path, test_name="disabled")
+    logging.disable(logging.CRITICAL)
+    try:
+        tester.logger.warning("suppressed")
+        assert "suppressed" not in capsys.readouterr().err
+    finally:
+        logging.disable(logging.NOTSET)
+        tester.close()
@@ -0,0 +1,44 @@
+"""Tests for escape-count parsing in measure_success_rate."""
+
+import json
+
+from measure_success_rate import parse_json_escapes
+
+
+def response(escapes, static_escapes=None):
+    body = {"session_id": "s1", "summary": {"escapes": escapes}}
+    if static_escapes is not None:
+        body["static_analysis"] = {"summary": {"total_escapes": static_escapes}}
+    return json.dumps(body)
+
+
+def test_prefers_the_static_total():
+    assert parse_json_escapes(response(0, static_escapes=2)) == 2
+
+
+def test_static_zero_is_not_overridden_by_dynamic():
+    assert parse_json_escapes(response(3, static_escapes=0)) == 0
+
+
+def test_falls_back_to_the_dynamic_summary():
+    assert parse_json_escapes(response(1)) == 1
+
+
+def test_skips_log_lines_before_the_json():
+    stdout = "Building analyzer...\n[INFO] running case\n" + response(0, static_escapes=4) + "\n"
+    assert parse_json_escapes(stdout) == 4
+
+
+def test_uses_the_last_json_line():
+    stdout = response(0, static_escapes=1) + "\nprogress\n" + response(0, static_escapes=5)
+    assert parse_json_escapes(stdout) == 5
+
+
+def test_returns_none_without_json():
+    assert parse_json_escapes("  Total Escapes: 3\n") is None
+
+
+def test_returns_none_for_malformed_responses():
+    assert parse_json_escapes("{not json") is None
+    assert parse_json_escapes(json.dumps({"summary": {}})) is None
+    assert parse_json_escapes(json.dumps({"static_analysis": {"summary": None}})) is None